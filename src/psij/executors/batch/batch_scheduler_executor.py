@@ -504,6 +504,12 @@ class BatchSchedulerExecutor(JobExecutor):
         # choice
         return '%s:%s:%s' % (int(d.total_seconds()) // 3600, (d.seconds // 60) % 60, d.seconds % 60)
 
+    def _run_status_command(self, native_ids: Collection[str]) -> str:
+        # Runs the command obtained from get_status_command() and returns its output. This is
+        # what the queue polling thread invokes; subclasses can override it in order to reduce
+        # the load on the queuing system (e.g., by caching or coalescing status queries).
+        return self._run_command(self.get_status_command(native_ids))
+
     def _run_command(self, cmd: List[str]) -> str:
         res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         if res.returncode != 0:
@@ -660,7 +666,7 @@ class _QueuePollThread(Thread):
             jobs_copy = dict(self._jobs)
         logger.info('Polling for %s jobs', len(jobs_copy))
         try:
-            out = self.executor._run_command(self.executor.get_status_command(jobs_copy.keys()))
+            out = self.executor._run_status_command(jobs_copy.keys())
         except subprocess.CalledProcessError as ex:
             out = ex.output
             exit_code = ex.returncode
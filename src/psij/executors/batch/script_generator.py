@@ -1,5 +1,6 @@
 import pathlib
 from abc import ABC
+from threading import Lock
 from typing import Dict, Callable, IO
 
 import pystache
@@ -8,6 +9,23 @@ from psij import Job, JobExecutorConfig
 from .escape_functions import bash_escape
 
 
+# parsed templates, keyed by template path; parsing a Mustache template is a pure Python
+# operation that is far more expensive than rendering it, so templates are parsed at most
+# once per process and shared by all generator instances
+_parsed_templates: Dict[pathlib.Path, object] = {}
+_parsed_templates_lock = Lock()
+
+
+def _parse_template(template_path: pathlib.Path) -> object:
+    with _parsed_templates_lock:
+        parsed = _parsed_templates.get(template_path)
+        if parsed is None:
+            with template_path.open('r') as template_file:
+                parsed = pystache.parse(template_file.read())
+            _parsed_templates[template_path] = parsed
+        return parsed
+
+
 class SubmitScriptGenerator(ABC):
     """A base class representing a submit script generator.
 
@@ -70,8 +88,7 @@ class TemplatedScriptGenerator(SubmitScriptGenerator):
             strings for use in bash scripts is used.
         """
         super().__init__(config)
-        with template_path.open('r') as template_file:
-            self.template = pystache.parse(template_file.read())
+        self.template = _parse_template(template_path)
         self.renderer = pystache.Renderer(escape=escape)
 
     def generate_submit_script(self, job: Job, context: Dict[str, object], out: IO[str]) -> None:
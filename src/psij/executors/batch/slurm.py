@@ -1,6 +1,16 @@
+import csv
+import logging
+import shlex
+import subprocess
+import sys
+import time
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional, Collection, List, Dict, IO
+from threading import Lock, Thread
+from types import MappingProxyType
+from concurrent.futures import Future
+from typing import Optional, Callable, Collection, List, Dict, FrozenSet, IO, Mapping, Sequence, \
+    Set, Tuple
 
 from psij import Job, JobStatus, JobState, SubmitException
 from psij.executors.batch.batch_scheduler_executor import BatchSchedulerExecutor, \
@@ -8,13 +18,291 @@ from psij.executors.batch.batch_scheduler_executor import BatchSchedulerExecutor
 from psij.executors.batch.script_generator import TemplatedScriptGenerator
 
 
+logger = logging.getLogger(__name__)
+
 _SQUEUE_COMMAND = 'squeue'
 
+_TEMPLATE_PATH = Path(__file__).parent / 'slurm' / 'slurm.mustache'
+
+# prefixes sbatch output lines in the wrapper script used by submit_many, so that they can
+# be told apart from any other output produced by sbatch or the scripts it runs
+_SUBMIT_MARKER = 'PSIJ_SUBMIT:'
+
+# state codes already warned about, so that an unknown code is only logged once
+_warned_states: Set[str] = set()
+
+
+def _unknown_state(state: str) -> JobState:
+    # Handles a state code introduced by a newer Slurm version; rather than crashing the
+    # poll thread, assume the job is still in the queue and wait for a known code.
+    if state not in _warned_states:
+        _warned_states.add(state)
+        logger.warning('Unknown Slurm state code: %s', state)
+    return JobState.QUEUED
+
+
+class _StatusCommandCache:
+    # Caches the output of squeue for a short period of time. A single instance of this class
+    # is shared by all executor instances in this process, so that repeated polls for the same
+    # set of jobs within the TTL reuse the output of a single squeue invocation rather than
+    # each spawning a subprocess and issuing a separate RPC to the Slurm controller.
+    #
+    # Concurrent queries are also coalesced: if a query for a set of ids comes in while a
+    # query for those ids (or a superset of them, whose output necessarily covers them) is
+    # already running, the caller waits for the running query instead of launching its own.
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # maps a set of native ids to (expiration time, output)
+        self._entries: Dict[FrozenSet[str], Tuple[float, str]] = {}
+        # queries currently running, keyed by the set of ids they cover
+        self._in_flight: Dict[FrozenSet[str], 'Future[str]'] = {}
+
+    def fetch(self, ids: FrozenSet[str], ttl: float, run: Callable[[], str]) -> str:
+        wait_for: Optional['Future[str]'] = None
+        with self._lock:
+            entry = self._entries.get(ids)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            for key, in_flight in self._in_flight.items():
+                if ids <= key:
+                    wait_for = in_flight
+                    break
+            if wait_for is None:
+                future: 'Future[str]' = Future()
+                self._in_flight[ids] = future
+        if wait_for is not None:
+            # an equivalent query is in flight; wait for its output (or its exception,
+            # which result() re-raises, matching what running the command would do)
+            return wait_for.result()
+        try:
+            out = run()
+        except BaseException as ex:
+            with self._lock:
+                del self._in_flight[ids]
+            future.set_exception(ex)
+            raise
+        now = time.monotonic()
+        with self._lock:
+            del self._in_flight[ids]
+            # evict expired entries so that the cache does not grow indefinitely as the set
+            # of polled jobs changes over time
+            for key in [k for k, v in self._entries.items() if now >= v[0]]:
+                del self._entries[key]
+            if ttl > 0:
+                self._entries[ids] = (now + ttl, out)
+        future.set_result(out)
+        return out
+
+
+_status_cache = _StatusCommandCache()
+
+
+class _SqueueStreamer(Thread):
+    # Consumes the output of a single long-lived `squeue -i <interval>` process, which prints
+    # a report of all of the user's jobs every `interval` seconds, and keeps the most recent
+    # complete report as a snapshot. Serving status queries from the snapshot makes them
+    # dictionary lookups and eliminates the per-poll subprocess spawn and controller RPC
+    # entirely. A single streamer is shared by all executor instances in this process.
+    def __init__(self, interval: int) -> None:
+        super().__init__(name='Slurm Status Streamer')
+        self.daemon = True
+        self.interval = interval
+        self.failed = False
+        self._lock = Lock()
+        # native_id -> (state code, reason); None until the first complete report is seen
+        self._snapshot: Optional[Dict[str, Tuple[str, str]]] = None
+        self._updated = 0.0
+
+    def run(self) -> None:
+        try:
+            proc = subprocess.Popen([_SQUEUE_COMMAND, '-i', str(self.interval), '-O',
+                                     'JobArrayID,StateCompact,Reason', '-t', 'all', '--me'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True)
+            assert proc.stdout is not None
+            # a report consists of a header line followed by one line per job; a report is
+            # known to be complete when the next report's header arrives. Depending on the
+            # Slurm version, iterations are also separated by a blank line and/or a date
+            # line; only a genuine header marks a report boundary, since committing on any
+            # non-job line would repeatedly clobber the snapshot with the just-reset
+            # empty report.
+            report: Optional[Dict[str, Tuple[str, str]]] = None
+            for line in proc.stdout:
+                if line[:1].isdigit():
+                    if report is not None:
+                        cols = line.split()
+                        if len(cols) >= 2:
+                            report[cols[0]] = (cols[1], cols[2] if len(cols) > 2 else '')
+                else:
+                    first = line.split(maxsplit=1)
+                    if first and first[0] in ('JOBID', 'JOBARRAYID'):
+                        if report is not None:
+                            with self._lock:
+                                self._snapshot = report
+                                self._updated = time.monotonic()
+                        report = {}
+                    # any other line (blank or date separator) is ignored
+            logger.warning('Slurm status streaming process exited')
+        except Exception as ex:
+            logger.warning('Slurm status streaming failed: %s', ex)
+        self.failed = True
+
+    def snapshot(self) -> Tuple[Optional[Dict[str, Tuple[str, str]]], float]:
+        with self._lock:
+            return self._snapshot, self._updated
+
+
+_streamer: Optional[_SqueueStreamer] = None
+_streamer_lock = Lock()
+
+
+def _get_streamer(interval: int) -> _SqueueStreamer:
+    global _streamer
+    with _streamer_lock:
+        if _streamer is None:
+            _streamer = _SqueueStreamer(interval)
+            _streamer.start()
+        return _streamer
+
+
+# see https://slurm.schedmd.com/squeue.html
+# the keys are interned so that state codes interned while parsing squeue output hit the
+# pointer-comparison fast path in the dict probe; the mapping proxies keep these shared,
+# module-level tables read-only
+_STATE_MAP: Mapping[str, JobState] = MappingProxyType({sys.intern(k): v for k, v in {
+    'BF': JobState.FAILED,
+    'CA': JobState.CANCELED,
+    'CD': JobState.COMPLETED,
+    'CF': JobState.QUEUED,
+    'CG': JobState.ACTIVE,
+    'DL': JobState.FAILED,
+    'F': JobState.FAILED,
+    'NF': JobState.FAILED,
+    'OOM': JobState.FAILED,
+    'PD': JobState.QUEUED,
+    'PR': JobState.FAILED,
+    'R': JobState.ACTIVE,
+    'RD': JobState.QUEUED,
+    'RF': JobState.QUEUED,
+    'RH': JobState.QUEUED,
+    'RQ': JobState.ACTIVE,
+    'SO': JobState.ACTIVE,
+    'TO': JobState.FAILED,
+    # TODO: double-check these
+    'RS': JobState.ACTIVE,
+    'RV': JobState.QUEUED,
+    'SI': JobState.ACTIVE,
+    'SE': JobState.ACTIVE,
+    'ST': JobState.ACTIVE,
+    'S': JobState.ACTIVE
+}.items()})
+
+# see https://slurm.schedmd.com/squeue.html
+_REASONS_MAP: Mapping[str, str] = MappingProxyType({sys.intern(k): v for k, v in {
+    'AssociationJobLimit': 'The job\'s association has reached its maximum job count.',
+    'AssociationResourceLimit': 'The job\'s association has reached some resource limit.',
+    'AssociationTimeLimit': 'The job\'s association has reached its time limit.',
+    'BadConstraints': 'The job\'s constraints can not be satisfied.',
+    'BeginTime': 'The job\'s earliest start time has not yet been reached.',
+    'Cleaning': 'The job is being requeued and still cleaning up from its previous execution.',
+    'Dependency': 'This job is waiting for a dependent job to complete.',
+    'FrontEndDown': 'No front end node is available to execute this job.',
+    'InactiveLimit': 'The job reached the system InactiveLimit.',
+    'InvalidAccount': 'The job\'s account is invalid.',
+    'InvalidQOS': 'The job\'s QOS is invalid.',
+    'JobHeldAdmin': 'The job is held by a system administrator.',
+    'JobHeldUser': 'The job is held by the user.',
+    'JobLaunchFailure': 'The job could not be launched.This may be due to a file system '
+                        'problem, invalid program name, etc.',
+    'Licenses': 'The job is waiting for a license.',
+    'NodeDown': 'A node required by the job is down.',
+    'NonZeroExitCode': 'The job terminated with a non-zero exit code.',
+    'PartitionDown': 'The partition required by this job is in a DOWN state.',
+    'PartitionInactive': 'The partition required by this job is in an Inactive state and not '
+                         'able to start jobs.',
+    'PartitionNodeLimit': 'The number of nodes required by this job is outside of its '
+                          'partition\'s current limits. Can also indicate that required nodes '
+                          'are DOWN or DRAINED.',
+    'PartitionTimeLimit': 'The job\'s time limit exceeds its partition\'s current time limit.',
+    'Priority': 'One or more higher priority jobs exist for this partition or advanced '
+                'reservation.',
+    'Prolog': 'Its PrologSlurmctld program is still running.',
+    'QOSJobLimit': 'The job\'s QOS has reached its maximum job count.',
+    'QOSResourceLimit': 'The job\'s QOS has reached some resource limit.',
+    'QOSTimeLimit': 'The job\'s QOS has reached its time limit.',
+    'ReqNodeNotAvail': 'Some node specifically required by the job is not currently available. '
+                       'The node may currently be in use, reserved for another job, in an '
+                       'advanced reservation, DOWN, DRAINED, or not responding. Nodes which '
+                       'are DOWN, DRAINED, or not responding will be identified as part of '
+                       'the job\'s "reason" field as "UnavailableNodes". Such nodes will '
+                       'typically require the intervention of a system administrator to make '
+                       'available.',
+    'Reservation': 'The job is waiting its advanced reservation to become available.',
+    'Resources': 'The job is waiting for resources to become available.',
+    'SystemFailure': 'Failure of the Slurm system, a file system, the network, etc.',
+    'TimeLimit': 'The job exhausted its time limit.',
+    'QOSUsageThreshold': 'Required QOS threshold has been breached.',
+    'WaitingForScheduling': 'No reason has been set for this job yet. Waiting for the '
+                            'scheduler to determine the appropriate reason.'
+}.items()})
+
 
 class SlurmExecutorConfig(BatchSchedulerExecutorConfig):
     """A configuration class for the Slurm executor."""
 
-    pass
+    def __init__(self, launcher_log_file: Optional[Path] = None,
+                 work_directory: Optional[Path] = None, queue_polling_interval: int = 30,
+                 initial_queue_polling_delay: int = 2,
+                 queue_polling_error_threshold: int = 2,
+                 keep_files: bool = False,
+                 status_cache_ttl: float = 5.0,
+                 only_job_state: bool = False,
+                 status_stream_interval: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        launcher_log_file
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        work_directory
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        queue_polling_interval
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        initial_queue_polling_delay
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        queue_polling_error_threshold
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        keep_files
+            See :class:`~.BatchSchedulerExecutorConfig`.
+        status_cache_ttl
+            The time, in seconds, for which the output of ``squeue`` is reused for repeated
+            status queries covering the same set of jobs. Within that time, such queries (e.g.,
+            issued by multiple executor instances polling concurrently) do not spawn additional
+            ``squeue`` processes and, therefore, do not issue additional RPCs to the Slurm
+            controller. A value of zero disables the caching.
+        only_job_state
+            If `True`, status queries are issued with ``squeue --only-job-state``, which
+            allows the controller to serve them from its in-memory job state cache rather
+            than materializing full job records. This requires Slurm 24.05 or later (older
+            versions reject the flag, which would cause every status poll to fail), and no
+            failure reason is available for failed jobs, which is why it is off by default.
+        status_stream_interval
+            If set, a single long-lived ``squeue -i <status_stream_interval> --me`` process,
+            shared by all Slurm executors in this process, is started on first use and status
+            queries are served from its streamed reports, falling back to a synchronous
+            ``squeue`` only for jobs missing from the latest report (e.g., ones submitted
+            after it was produced). This eliminates the subprocess spawn and the controller
+            RPC from steady-state polling at the cost of job states being up to
+            `status_stream_interval` seconds old. If `None` (the default), every poll runs
+            its own ``squeue``, subject to the caching described above.
+        """
+        super().__init__(launcher_log_file=launcher_log_file, work_directory=work_directory,
+                         queue_polling_interval=queue_polling_interval,
+                         initial_queue_polling_delay=initial_queue_polling_delay,
+                         queue_polling_error_threshold=queue_polling_error_threshold,
+                         keep_files=keep_files)
+        self.status_cache_ttl = status_cache_ttl
+        self.only_job_state = only_job_state
+        self.status_stream_interval = status_stream_interval
 
 
 class SlurmJobExecutor(BatchSchedulerExecutor):
@@ -35,84 +323,6 @@ class SlurmJobExecutor(BatchSchedulerExecutor):
     `#SBATCH --qos=debug` to be placed in the submit script.
     """
 
-    # see https://slurm.schedmd.com/squeue.html
-    _STATE_MAP = {
-        'BF': JobState.FAILED,
-        'CA': JobState.CANCELED,
-        'CD': JobState.COMPLETED,
-        'CF': JobState.QUEUED,
-        'CG': JobState.ACTIVE,
-        'DL': JobState.FAILED,
-        'F': JobState.FAILED,
-        'NF': JobState.FAILED,
-        'OOM': JobState.FAILED,
-        'PD': JobState.QUEUED,
-        'PR': JobState.FAILED,
-        'R': JobState.ACTIVE,
-        'RD': JobState.QUEUED,
-        'RF': JobState.QUEUED,
-        'RH': JobState.QUEUED,
-        'RQ': JobState.ACTIVE,
-        'SO': JobState.ACTIVE,
-        'TO': JobState.FAILED,
-        # TODO: double-check these
-        'RS': JobState.ACTIVE,
-        'RV': JobState.QUEUED,
-        'SI': JobState.ACTIVE,
-        'SE': JobState.ACTIVE,
-        'ST': JobState.ACTIVE,
-        'S': JobState.ACTIVE
-    }
-
-    # see https://slurm.schedmd.com/squeue.html
-    _REASONS_MAP = {
-        'AssociationJobLimit': 'The job\'s association has reached its maximum job count.',
-        'AssociationResourceLimit': 'The job\'s association has reached some resource limit.',
-        'AssociationTimeLimit': 'The job\'s association has reached its time limit.',
-        'BadConstraints': 'The job\'s constraints can not be satisfied.',
-        'BeginTime': 'The job\'s earliest start time has not yet been reached.',
-        'Cleaning': 'The job is being requeued and still cleaning up from its previous execution.',
-        'Dependency': 'This job is waiting for a dependent job to complete.',
-        'FrontEndDown': 'No front end node is available to execute this job.',
-        'InactiveLimit': 'The job reached the system InactiveLimit.',
-        'InvalidAccount': 'The job\'s account is invalid.',
-        'InvalidQOS': 'The job\'s QOS is invalid.',
-        'JobHeldAdmin': 'The job is held by a system administrator.',
-        'JobHeldUser': 'The job is held by the user.',
-        'JobLaunchFailure': 'The job could not be launched.This may be due to a file system '
-                            'problem, invalid program name, etc.',
-        'Licenses': 'The job is waiting for a license.',
-        'NodeDown': 'A node required by the job is down.',
-        'NonZeroExitCode': 'The job terminated with a non-zero exit code.',
-        'PartitionDown': 'The partition required by this job is in a DOWN state.',
-        'PartitionInactive': 'The partition required by this job is in an Inactive state and not '
-                             'able to start jobs.',
-        'PartitionNodeLimit': 'The number of nodes required by this job is outside of its '
-                              'partition\'s current limits. Can also indicate that required nodes '
-                              'are DOWN or DRAINED.',
-        'PartitionTimeLimit': 'The job\'s time limit exceeds its partition\'s current time limit.',
-        'Priority': 'One or more higher priority jobs exist for this partition or advanced '
-                    'reservation.',
-        'Prolog': 'Its PrologSlurmctld program is still running.',
-        'QOSJobLimit': 'The job\'s QOS has reached its maximum job count.',
-        'QOSResourceLimit': 'The job\'s QOS has reached some resource limit.',
-        'QOSTimeLimit': 'The job\'s QOS has reached its time limit.',
-        'ReqNodeNotAvail': 'Some node specifically required by the job is not currently available. '
-                           'The node may currently be in use, reserved for another job, in an '
-                           'advanced reservation, DOWN, DRAINED, or not responding. Nodes which '
-                           'are DOWN, DRAINED, or not responding will be identified as part of '
-                           'the job\'s "reason" field as "UnavailableNodes". Such nodes will '
-                           'typically require the intervention of a system administrator to make '
-                           'available.',
-        'Reservation': 'The job is waiting its advanced reservation to become available.',
-        'Resources': 'The job is waiting for resources to become available.',
-        'SystemFailure': 'Failure of the Slurm system, a file system, the network, etc.',
-        'TimeLimit': 'The job exhausted its time limit.',
-        'QOSUsageThreshold': 'Required QOS threshold has been breached.',
-        'WaitingForScheduling': 'No reason has been set for this job yet. Waiting for the '
-                                'scheduler to determine the appropriate reason.'
-    }
-
     def __init__(self, url: Optional[str] = None, config: Optional[SlurmExecutorConfig] = None):
         """
         Parameters
@@ -125,8 +335,29 @@ class SlurmJobExecutor(BatchSchedulerExecutor):
         if not config:
             config = SlurmExecutorConfig()
         super().__init__(config=config)
-        self.generator = TemplatedScriptGenerator(config, Path(__file__).parent / 'slurm'
-                                                  / 'slurm.mustache')
+        self._status_cache_ttl = config.status_cache_ttl
+        self._only_job_state = config.only_job_state
+        self._stream_interval = config.status_stream_interval
+        self._generator: Optional[TemplatedScriptGenerator] = None
+        # the last id set passed to get_status_command and the corresponding joined string;
+        # in steady-state polling the set is stable, so the string need not be rebuilt
+        self._joined_ids: Optional[Tuple[FrozenSet[str], str]] = None
+        # cached so that making submit paths absolute does not incur a getcwd() syscall
+        # on every submission; submit paths are normally generated under the (absolute)
+        # work directory anyway
+        self._cwd = Path.cwd()
+
+    @property
+    def generator(self) -> TemplatedScriptGenerator:
+        """The submit script generator used by this executor.
+
+        The generator is created on first use, so that executors that never submit a fresh
+        job (e.g., ones used only to attach to or cancel existing jobs) do not pay for
+        loading the submit script template.
+        """
+        if self._generator is None:
+            self._generator = TemplatedScriptGenerator(self.config, _TEMPLATE_PATH)
+        return self._generator
 
     def generate_submit_script(self, job: Job, context: Dict[str, object],
                                submit_file: IO[str]) -> None:
@@ -135,7 +366,80 @@ class SlurmJobExecutor(BatchSchedulerExecutor):
 
     def get_submit_command(self, job: Job, submit_file_path: Path) -> List[str]:
         """See :meth:`~.BatchSchedulerExecutor.get_submit_command`."""
-        return ['sbatch', str(submit_file_path.absolute())]
+        return ['sbatch', str(self._absolute(submit_file_path))]
+
+    def _absolute(self, path: Path) -> Path:
+        return path if path.is_absolute() else self._cwd / path
+
+    def submit_many(self, jobs: Sequence[Job]) -> None:
+        """Submits multiple jobs using a single subprocess invocation.
+
+        This is functionally equivalent to calling :func:`~psij.JobExecutor.submit` once for
+        each job in `jobs`. However, rather than spawning one ``sbatch`` process per job from
+        Python, all submit scripts are generated up front and a single wrapper script, which
+        invokes ``sbatch`` once for each job, is executed. For workloads submitting many jobs
+        at a time, this replaces N fork/exec pairs on the Python side with one.
+
+        Parameters
+        ----------
+        jobs
+            The jobs to be submitted.
+
+        Raises
+        ------
+        SubmitException
+            If one of the submissions fails. Jobs whose submission completed before the
+            failure remain submitted and have their native id set; the remaining jobs are
+            not submitted.
+        """
+        if len(jobs) == 0:
+            return
+        self._ensure_work_dir()
+
+        wrapper_path = self.work_directory / (jobs[0].id + '.batch')
+        with wrapper_path.open('w') as wrapper:
+            wrapper.write('#!/bin/bash\n')
+            for job in jobs:
+                logger.info('Job %s: submitting', job.id)
+                self._check_job(job)
+                context = self._create_script_context(job)
+                # assumes job ids are unique
+                submit_file_path = self.work_directory / (job.id + '.job')
+                with submit_file_path.open('w') as submit_file:
+                    self.generate_submit_script(job, context, submit_file)
+                # the marker identifies output lines carrying a job id; a failed sbatch
+                # stops the wrapper so that output lines map, in order, to submitted jobs
+                wrapper.write('out=$(sbatch %s) || exit 1\n'
+                              % shlex.quote(str(self._absolute(submit_file_path))))
+                wrapper.write('echo "%s$out"\n' % _SUBMIT_MARKER)
+
+        error: Optional[subprocess.CalledProcessError] = None
+        try:
+            out = self._run_command(['/bin/bash', str(self._absolute(wrapper_path))])
+        except subprocess.CalledProcessError as ex:
+            out = ex.output
+            error = ex
+        finally:
+            assert isinstance(self.config, BatchSchedulerExecutorConfig)
+            if not self.config.keep_files:
+                wrapper_path.unlink()
+
+        submitted = 0
+        for line in out.splitlines():
+            if not line.startswith(_SUBMIT_MARKER) or submitted == len(jobs):
+                continue
+            job = jobs[submitted]
+            job._native_id = self.job_id_from_submit_output(line[len(_SUBMIT_MARKER):])
+            logger.info('Job %s: native id: %s', job.id, job.native_id)
+            self._set_job_status(job, JobStatus(JobState.QUEUED,
+                                                metadata={'native_id': job.native_id}))
+            self._queue_poll_thread.register_job(job)
+            submitted += 1
+
+        if error is not None or submitted < len(jobs):
+            raise SubmitException('Failed to submit %s out of %s jobs: %s'
+                                  % (len(jobs) - submitted, len(jobs),
+                                     error.output if error else out)) from None
 
     def get_cancel_command(self, native_id: str) -> List[str]:
         """See :meth:`~.BatchSchedulerExecutor.get_cancel_command`."""
@@ -147,29 +451,107 @@ class SlurmJobExecutor(BatchSchedulerExecutor):
 
     def get_status_command(self, native_ids: Collection[str]) -> List[str]:
         """See :meth:`~.BatchSchedulerExecutor.get_status_command`."""
-        ids = ','.join(native_ids)
+        key = frozenset(native_ids)
+        cached = self._joined_ids
+        if cached is not None and cached[0] == key:
+            ids = cached[1]
+        else:
+            ids = ','.join(native_ids)
+            self._joined_ids = (key, ids)
 
         # we're not really using job arrays, so this is equivalent to the job ID. However, if
         # we were to use arrays, this would return one ID for the entire array rather than
         # listing each element of the array independently
+        if self._only_job_state:
+            # lets the controller answer from its job state cache; no failure reason available
+            return [_SQUEUE_COMMAND, '--only-job-state', '-O', 'JobArrayID,StateCompact',
+                    '-t', 'all', '-j', ids]
         return [_SQUEUE_COMMAND, '-O', 'JobArrayID,StateCompact,Reason', '-t', 'all', '-j', ids]
 
+    def _run_status_command(self, native_ids: Collection[str]) -> str:
+        # see BatchSchedulerExecutor._run_status_command; if status streaming is enabled,
+        # polls are served from the streamed reports; otherwise, successful squeue outputs
+        # are cached for a short time so that repeated polls for the same jobs reuse a single
+        # invocation, and concurrent polls for overlapping sets of jobs share a single
+        # squeue process
+        if self._stream_interval is not None:
+            out = self._streamed_status(native_ids)
+            if out is not None:
+                return out
+        run = super()._run_status_command
+        return _status_cache.fetch(frozenset(native_ids), self._status_cache_ttl,
+                                   lambda: run(native_ids))
+
+    def _streamed_status(self, native_ids: Collection[str]) -> Optional[str]:
+        # Builds output equivalent to that of the synchronous status command from the
+        # streamer's latest report. Returns None if the streamer is not (yet) usable, in
+        # which case the caller is expected to run a synchronous query instead.
+        assert self._stream_interval is not None
+        streamer = _get_streamer(self._stream_interval)
+        if streamer.failed:
+            return None
+        snapshot, updated = streamer.snapshot()
+        if snapshot is None or time.monotonic() - updated > 2 * streamer.interval + 15:
+            # no complete report yet, or the report is stale (e.g., squeue stopped producing
+            # output without exiting)
+            return None
+        missing = []
+        lines = ['JOBID STATE REASON']
+        for native_id in native_ids:
+            entry = snapshot.get(native_id)
+            if entry is None:
+                # either completed and purged from the queue or submitted after the report
+                # was produced; only a synchronous query can tell the difference
+                missing.append(native_id)
+            else:
+                lines.append('%s %s %s' % (native_id, entry[0], entry[1]))
+        out = '\n'.join(lines) + '\n'
+        if missing:
+            sync_out = super()._run_status_command(missing)
+            # drop the header line; ours is already in place
+            header_end = sync_out.find('\n')
+            if header_end != -1:
+                out += sync_out[header_end + 1:]
+        return out
+
     def parse_status_output(self, exit_code: int, out: str) -> Dict[str, JobStatus]:
         """See :meth:`~.BatchSchedulerExecutor.parse_status_output`."""
         check_status_exit_code(_SQUEUE_COMMAND, exit_code, out)
-        r = {}
-        lines = iter(out.split('\n'))
-        # skip header
-        lines.__next__()
-        for line in lines:
-            if not line:
+        r: Dict[str, JobStatus] = {}
+        # once all tracked jobs have left the queue, the output shrinks to the header line;
+        # skip the reader setup entirely for that steady-state "nothing to report" poll
+        if '\n' not in out.rstrip():
+            return r
+        # the C implementation backing csv.reader tokenizes the rows considerably faster
+        # than a Python-level split() loop; splitlines() is likewise C-implemented and,
+        # unlike iterating a StringIO, also handles \r\n line endings; quoting is disabled
+        # since squeue output is not quoted and a stray quote character in a reason field
+        # must not be allowed to swallow subsequent rows
+        reader = csv.reader(out.splitlines(), delimiter=' ', skipinitialspace=True,
+                            quoting=csv.QUOTE_NONE)
+        # skip the header line
+        next(reader, None)
+        # bind the hot lookups to locals; this avoids two method dispatches per parsed row,
+        # which adds up for status responses covering many jobs
+        get_state = _STATE_MAP.get
+        get_message = _REASONS_MAP.get
+        intern = sys.intern
+        failed = JobState.FAILED
+        for row in reader:
+            # rows may carry a trailing empty field due to column padding
+            if len(row) < 2 or not row[0]:
                 continue
-            cols = line.split()
-            assert len(cols) == 3
-            native_id = cols[0]
-            state = self._get_state(cols[1])
-            msg = self._get_message(cols[2]) if state == JobState.FAILED else None
-            r[native_id] = JobStatus(state, message=msg)
+            # poll outputs are dominated by a handful of state codes; interning them makes
+            # the map probes hit the pointer-equality fast path
+            code = intern(row[1])
+            state = get_state(code)
+            if state is None:
+                state = _unknown_state(code)
+            # with --only-job-state, no Reason column is requested; fall back to the raw
+            # reason code for codes missing from the map
+            reason = row[2] if len(row) > 2 and row[2] else None
+            msg = get_message(reason, reason) if reason is not None and state is failed else None
+            r[row[0]] = JobStatus(state, message=msg)
 
         return r
 
@@ -177,14 +559,6 @@ class SlurmJobExecutor(BatchSchedulerExecutor):
         """See :meth:`~.BatchSchedulerExecutor.get_list_command`."""
         return ['squeue', '--me', '-o', '%i', '-h', '-r', '-t', 'all']
 
-    def _get_state(self, state: str) -> JobState:
-        assert state in SlurmJobExecutor._STATE_MAP
-        return SlurmJobExecutor._STATE_MAP[state]
-
-    def _get_message(self, reason: str) -> str:
-        assert reason in SlurmJobExecutor._REASONS_MAP
-        return SlurmJobExecutor._REASONS_MAP[reason]
-
     def job_id_from_submit_output(self, out: str) -> str:
         """See :meth:`~.BatchSchedulerExecutor.job_id_from_submit_output`."""
         return out.strip().split()[-1]
@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 import tempfile
@@ -47,7 +48,19 @@ def assert_completed(job: Job, status: Optional[JobStatus], attached: bool = Fal
                                  % (status.exit_code, status.message))
 
 
-def _get_executor_instance(ep: ExecutorTestParams, job: Optional[Job] = None) -> JobExecutor:
+@functools.lru_cache(maxsize=None)
+def _cached_executor(executor: str, url: Optional[str]) -> JobExecutor:
+    # executor initialization (config parsing, submit script template loading) is not
+    # entirely cheap, so instances are shared across tests rather than re-created for
+    # every test in the suite
+    return JobExecutor.get_instance(executor, url=url)
+
+
+def _get_executor_instance(ep: ExecutorTestParams, job: Optional[Job] = None,
+                           fresh: bool = False) -> JobExecutor:
+    # tests that specifically exercise cross-instance behavior (e.g., attaching to a job
+    # submitted through another executor instance) can request a non-cached instance by
+    # passing fresh=True
     if job is not None:
         assert job.spec is not None
         job.spec.launcher = ep.launcher
@@ -56,7 +69,9 @@ def _get_executor_instance(ep: ExecutorTestParams, job: Optional[Job] = None) ->
             job.spec.attributes.account = ep.account
         if ep.queue_name is not None:
             job.spec.attributes.queue_name = ep.queue_name
-    return JobExecutor.get_instance(ep.executor, url=ep.url)
+    if fresh:
+        return JobExecutor.get_instance(ep.executor, url=ep.url)
+    return _cached_executor(ep.executor, ep.url)
 
 
 @contextmanager
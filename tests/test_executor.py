@@ -61,7 +61,8 @@ def test_attach2(execparams: ExecutorTestParams) -> None:
 
     assert native_id is not None
     job2 = Job()
-    ex2 = _get_executor_instance(execparams)
+    # the attach must go through a second, fresh executor instance
+    ex2 = _get_executor_instance(execparams, fresh=True)
     ex2.attach(job2, native_id)
     status = job2.wait(timeout=_get_timeout(execparams))
     assert_completed(job2, status, attached=True)
@@ -0,0 +1,193 @@
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, cast
+
+import pytest
+
+from psij import Job, JobExecutor, JobSpec, JobState, SubmitException
+from psij.executors.batch.slurm import SlurmExecutorConfig, SlurmJobExecutor, _StatusCommandCache
+
+
+def _get_slurm_executor(config: Optional[SlurmExecutorConfig] = None) -> SlurmJobExecutor:
+    # the plugin mechanism loads the slurm module directly from its file rather than through
+    # the regular import system, so the class of the returned instance is a separate copy of
+    # the directly imported SlurmJobExecutor; the cast keeps the type checker aware of the
+    # Slurm-specific API, which is identical between the two copies
+    return cast(SlurmJobExecutor, JobExecutor.get_instance('slurm', config=config))
+
+
+def test_parse_status_output() -> None:
+    ex = _get_slurm_executor()
+    out = ('JOBID STATE REASON\n'
+           '1001 R None\n'
+           '1002 PD Priority\n'
+           '1003 F NonZeroExitCode\n')
+    r = ex.parse_status_output(0, out)
+    assert len(r) == 3
+    assert r['1001'].state == JobState.ACTIVE
+    assert r['1002'].state == JobState.QUEUED
+    assert r['1002'].message is None
+    assert r['1003'].state == JobState.FAILED
+    # the reason code of a failed job is translated to a human readable message
+    assert r['1003'].message == 'The job terminated with a non-zero exit code.'
+
+
+def test_parse_status_output_two_columns() -> None:
+    # with --only-job-state, squeue is asked for the id and state columns only
+    ex = _get_slurm_executor()
+    out = ('JOBID STATE\n'
+           '1001 R\n'
+           '1002 CD\n')
+    r = ex.parse_status_output(0, out)
+    assert len(r) == 2
+    assert r['1001'].state == JobState.ACTIVE
+    assert r['1002'].state == JobState.COMPLETED
+    assert r['1002'].message is None
+
+
+def test_parse_status_output_header_only() -> None:
+    # once all jobs have left the queue, only the header line remains
+    ex = _get_slurm_executor()
+    assert ex.parse_status_output(0, 'JOBID STATE REASON\n') == {}
+    assert ex.parse_status_output(0, 'JOBID STATE REASON') == {}
+
+
+def test_parse_status_output_unknown_code() -> None:
+    # a state code from a newer Slurm version must not crash the poll thread
+    ex = _get_slurm_executor()
+    r = ex.parse_status_output(0, 'JOBID STATE REASON\n1001 XX None\n')
+    assert r['1001'].state == JobState.QUEUED
+
+
+def test_parse_status_output_stray_quote() -> None:
+    # a quote character in a reason field must not swallow subsequent rows
+    ex = _get_slurm_executor()
+    out = ('JOBID STATE REASON\n'
+           '1001 PD "Priority\n'
+           '1002 R None\n')
+    r = ex.parse_status_output(0, out)
+    assert sorted(r.keys()) == ['1001', '1002']
+    assert r['1002'].state == JobState.ACTIVE
+
+
+def test_status_cache_hit() -> None:
+    cache = _StatusCommandCache()
+    ids = frozenset(['1001', '1002'])
+    calls: List[int] = []
+
+    def run() -> str:
+        calls.append(1)
+        return 'out'
+
+    assert cache.fetch(ids, 60.0, run) == 'out'
+    assert cache.fetch(ids, 60.0, run) == 'out'
+    assert len(calls) == 1
+
+
+def test_status_cache_expiry() -> None:
+    cache = _StatusCommandCache()
+    ids = frozenset(['1001'])
+    calls: List[int] = []
+
+    def run() -> str:
+        calls.append(1)
+        return 'out%s' % len(calls)
+
+    assert cache.fetch(ids, 0.05, run) == 'out1'
+    time.sleep(0.1)
+    assert cache.fetch(ids, 0.05, run) == 'out2'
+    assert len(calls) == 2
+
+
+def test_status_cache_coalescing() -> None:
+    cache = _StatusCommandCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls: List[int] = []
+    results: List[str] = []
+
+    def slow_run() -> str:
+        calls.append(1)
+        started.set()
+        assert release.wait(timeout=10)
+        return 'out'
+
+    t1 = threading.Thread(target=lambda: results.append(
+        cache.fetch(frozenset(['1001', '1002']), 0.0, slow_run)))
+    t1.start()
+    assert started.wait(timeout=10)
+    # a query for a subset of the ids of a query already in flight must wait for that query
+    # rather than running its own
+    t2 = threading.Thread(target=lambda: results.append(
+        cache.fetch(frozenset(['1001']), 0.0, lambda: 'other')))
+    t2.start()
+    # give the second fetch a chance to (incorrectly) invoke its command
+    time.sleep(0.2)
+    release.set()
+    t1.join(timeout=10)
+    t2.join(timeout=10)
+    assert results == ['out', 'out']
+    assert len(calls) == 1
+
+
+def test_status_cache_exception() -> None:
+    cache = _StatusCommandCache()
+    ids = frozenset(['1001'])
+
+    def fail() -> str:
+        raise RuntimeError('squeue failed')
+
+    with pytest.raises(RuntimeError):
+        cache.fetch(ids, 60.0, fail)
+    # the failed query must not leave a stale in-flight entry behind
+    assert cache.fetch(ids, 60.0, lambda: 'out') == 'out'
+
+
+_FAKE_SBATCH = '''#!/bin/bash
+count_file="%s"
+n=$(cat "$count_file" 2>/dev/null || echo 0)
+n=$((n + 1))
+echo $n > "$count_file"
+if [ -n "%s" ] && [ $n -eq %s ]; then
+    echo "sbatch: error: invalid job" >&2
+    exit 1
+fi
+echo "Submitted batch job $((1000 + n))"
+'''
+
+
+def _make_submit_executor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+                          fail_at: int = 0) -> SlurmJobExecutor:
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    sbatch = bin_dir / 'sbatch'
+    sbatch.write_text(_FAKE_SBATCH % (tmp_path / 'count', fail_at if fail_at else '', fail_at))
+    sbatch.chmod(0o755)
+    monkeypatch.setenv('PATH', str(bin_dir), prepend=':')
+    # a long polling delay keeps the poll thread from invoking (a nonexistent) squeue
+    # while the test is running
+    return _get_slurm_executor(SlurmExecutorConfig(work_directory=tmp_path / 'work',
+                                                   initial_queue_polling_delay=3600))
+
+
+def test_submit_many(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ex = _make_submit_executor(tmp_path, monkeypatch)
+    jobs = [Job(JobSpec(executable='/bin/date')) for _ in range(3)]
+    ex.submit_many(jobs)
+    # sbatch output lines must be paired to jobs in submission order
+    assert [job.native_id for job in jobs] == ['1001', '1002', '1003']
+    for job in jobs:
+        assert job.status.state == JobState.QUEUED
+
+
+def test_submit_many_partial_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ex = _make_submit_executor(tmp_path, monkeypatch, fail_at=2)
+    jobs = [Job(JobSpec(executable='/bin/date')) for _ in range(3)]
+    with pytest.raises(SubmitException):
+        ex.submit_many(jobs)
+    # the job submitted before the failure remains submitted; the others are not
+    assert jobs[0].native_id == '1001'
+    assert jobs[0].status.state == JobState.QUEUED
+    assert jobs[1].native_id is None
+    assert jobs[2].native_id is None